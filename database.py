@@ -14,6 +14,7 @@ class Database:
         try:
             self.conn = sqlite3.connect(self.db_path)
             self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
         except sqlite3.Error as e:
             raise ConnectionError(f"Failed to connect to database: {str(e)}")
     
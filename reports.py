@@ -0,0 +1,262 @@
+import argparse
+import csv
+import json
+import math
+import os
+import sqlite3
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+STATUSES = ["To Do", "In Progress", "Done"]
+SECONDS_PER_DAY = 86400.0
+
+# Seconds since the epoch, computed by SQLite so rows never pass through datetime.
+EPOCH_SQL = "(julianday({col}) - 2440587.5) * 86400.0"
+
+
+def open_readonly(db_path: str) -> sqlite3.Connection:
+    if not os.path.exists(db_path):
+        raise ConnectionError(f"Database not found: {db_path}")
+    try:
+        uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+    except sqlite3.Error as e:
+        raise ConnectionError(f"Failed to open database read-only: {str(e)}")
+
+
+def _scan_range(db_path: str, start_id: int, end_id: int, now: str, stale_cutoff: str) -> Dict:
+    """Aggregate the tasks with start_id <= id < end_id.
+
+    Runs in a worker process, so it opens its own read-only connection and
+    returns only plain, picklable values. Done tasks age until their last
+    update; every other task is still ageing, so it is measured up to now.
+    """
+    conn = open_readonly(db_path)
+    try:
+        cursor = conn.cursor()
+        bounds = (start_id, end_id)
+
+        status_counts = Counter()
+        status_age = Counter()
+        cursor.execute(f"""
+            SELECT status, COUNT(*),
+                   SUM(CASE WHEN status = 'Done'
+                            THEN {EPOCH_SQL.format(col='updated_at')}
+                            ELSE {EPOCH_SQL.format(col='?')}
+                       END - {EPOCH_SQL.format(col='created_at')})
+            FROM tasks WHERE id >= ? AND id < ?
+            GROUP BY status
+        """, (now,) + bounds)
+        for status, count, total_age in cursor.fetchall():
+            status_counts[status] = count
+            status_age[status] = total_age or 0.0
+
+        cursor.execute(f"""
+            SELECT {EPOCH_SQL.format(col='updated_at')} - {EPOCH_SQL.format(col='created_at')}
+            FROM tasks WHERE id >= ? AND id < ? AND status = 'Done'
+        """, bounds)
+        cycle_seconds = array('d', (row[0] for row in cursor))
+
+        cursor.execute("""
+            SELECT date(updated_at, '-6 days', 'weekday 1'), COUNT(*)
+            FROM tasks WHERE id >= ? AND id < ? AND status = 'Done'
+            GROUP BY 1
+        """, bounds)
+        weekly_done = Counter(dict(cursor.fetchall()))
+
+        cursor.execute("""
+            SELECT id, title, status, updated_at
+            FROM tasks WHERE id >= ? AND id < ? AND status != 'Done' AND updated_at < ?
+        """, bounds + (stale_cutoff,))
+        stale = cursor.fetchall()
+
+        return {
+            "status_counts": status_counts,
+            "status_age": status_age,
+            "cycle_seconds": cycle_seconds,
+            "weekly_done": weekly_done,
+            "stale": stale
+        }
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to scan tasks {start_id}-{end_id}: {str(e)}")
+    finally:
+        conn.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct * len(sorted_values) / 100.0) - 1, 0)
+    return sorted_values[rank]
+
+
+def _days(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds / SECONDS_PER_DAY, 3)
+
+
+class ReportGenerator:
+    def __init__(self, db_path: str = "kanban.db", workers: Optional[int] = None,
+                 chunk_size: int = 50000, stale_days: int = 14):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if stale_days < 0:
+            raise ValueError("Stale days cannot be negative")
+        self.db_path = db_path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.stale_days = stale_days
+
+    def id_ranges(self) -> List[Tuple[int, int]]:
+        conn = open_readonly(self.db_path)
+        try:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                print(f"Warning: {self.db_path} uses journal_mode={journal_mode}; "
+                      "report reads may block the board's writes until it is opened "
+                      "once by the GUI (which switches it to WAL)")
+            row = conn.execute("SELECT MIN(id), MAX(id) FROM tasks").fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to read task ids: {str(e)}")
+        finally:
+            conn.close()
+
+        low, high = row
+        if low is None:
+            return []
+        return [(start, min(start + self.chunk_size, high + 1))
+                for start in range(low, high + 1, self.chunk_size)]
+
+    def generate(self, now: Optional[datetime] = None) -> Dict:
+        now = now or datetime.now()
+        stale_cutoff = (now - timedelta(days=self.stale_days)).isoformat()
+        ranges = self.id_ranges()
+
+        status_counts = Counter()
+        status_age = Counter()
+        cycle_seconds = array('d')
+        weekly_done = Counter()
+        stale = []
+
+        if ranges:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(_scan_range, self.db_path, start, end,
+                                       now.isoformat(), stale_cutoff)
+                           for start, end in ranges]
+                for future in futures:
+                    part = future.result()
+                    status_counts.update(part["status_counts"])
+                    status_age.update(part["status_age"])
+                    cycle_seconds.extend(part["cycle_seconds"])
+                    weekly_done.update(part["weekly_done"])
+                    stale.extend(part["stale"])
+
+        cycle_sorted = sorted(cycle_seconds)
+        cycle_mean = sum(cycle_sorted) / len(cycle_sorted) if cycle_sorted else None
+        stale.sort(key=lambda task: task[3])
+
+        return {
+            "generated_at": now.isoformat(),
+            "database": self.db_path,
+            "total_tasks": sum(status_counts.values()),
+            "status": [
+                {
+                    "status": status,
+                    "count": status_counts[status],
+                    "avg_age_days": _days(status_age[status] / status_counts[status])
+                    if status_counts[status] else None
+                }
+                for status in STATUSES + sorted(set(status_counts) - set(STATUSES))
+            ],
+            "cycle_time_days": {
+                "count": len(cycle_sorted),
+                "mean": _days(cycle_mean),
+                "median": _days(_percentile(cycle_sorted, 50)),
+                "p85": _days(_percentile(cycle_sorted, 85)),
+                "p95": _days(_percentile(cycle_sorted, 95)),
+                "max": _days(cycle_sorted[-1] if cycle_sorted else None)
+            },
+            "weekly_throughput": [
+                {"week_start": week, "done": weekly_done[week]} for week in sorted(weekly_done)
+            ],
+            "stale_days": self.stale_days,
+            "stale_tasks": [
+                {
+                    "id": task_id,
+                    "title": title,
+                    "status": status,
+                    "updated_at": updated_at
+                }
+                for task_id, title, status, updated_at in stale
+            ]
+        }
+
+    def write_json(self, report: Dict, output_dir: str) -> List[str]:
+        path = os.path.join(output_dir, "report.json")
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return [path]
+
+    def write_csv(self, report: Dict, output_dir: str) -> List[str]:
+        cycle = report["cycle_time_days"]
+        tables = {
+            "status.csv": report["status"],
+            "cycle_time.csv": [{"metric": key, "days": value} for key, value in cycle.items()],
+            "throughput.csv": report["weekly_throughput"],
+            "stale_tasks.csv": report["stale_tasks"]
+        }
+        headers = {
+            "status.csv": ["status", "count", "avg_age_days"],
+            "cycle_time.csv": ["metric", "days"],
+            "throughput.csv": ["week_start", "done"],
+            "stale_tasks.csv": ["id", "title", "status", "updated_at"]
+        }
+
+        paths = []
+        for name, rows in tables.items():
+            path = os.path.join(output_dir, name)
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=headers[name])
+                writer.writeheader()
+                writer.writerows(rows)
+            paths.append(path)
+        return paths
+
+    def write(self, report: Dict, output_dir: str, fmt: str = "json") -> List[str]:
+        os.makedirs(output_dir, exist_ok=True)
+        if fmt == "json":
+            return self.write_json(report, output_dir)
+        if fmt == "csv":
+            return self.write_csv(report, output_dir)
+        raise ValueError(f"Unsupported report format: {fmt}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate offline Kanban board reports.")
+    parser.add_argument("db_path", nargs="?", default="kanban.db")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output-dir", default="reports")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--stale-days", type=int, default=14)
+    args = parser.parse_args()
+
+    try:
+        generator = ReportGenerator(args.db_path, workers=args.workers,
+                                    chunk_size=args.chunk_size, stale_days=args.stale_days)
+        report = generator.generate()
+        for path in generator.write(report, args.output_dir, args.format):
+            print(f"Wrote {path}")
+    except Exception as e:
+        print(f"Report failed: {str(e)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import csv
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from database import Database
+from reports import ReportGenerator, _percentile
+
+
+NOW = datetime(2026, 1, 10, 12, 0, 0)
+
+# (title, status, created_at, updated_at)
+TASKS = [
+    ("done 1d", "Done", "2025-12-29T09:00:00", "2025-12-30T09:00:00"),
+    ("done 2d", "Done", "2025-12-30T09:00:00", "2026-01-01T09:00:00"),
+    ("done 3d", "Done", "2026-01-01T09:00:00", "2026-01-04T09:00:00"),
+    ("done 4d", "Done", "2026-01-01T09:00:00", "2026-01-05T09:00:00"),
+    ("fresh todo", "To Do", "2026-01-09T12:00:00", "2026-01-09T12:00:00"),
+    ("old todo", "To Do", "2025-12-20T12:00:00", "2025-12-20T12:00:00"),
+    ("stale wip", "In Progress", "2025-12-01T12:00:00", "2025-12-25T12:00:00"),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "kanban.db")
+    db = Database(path)
+    db.conn.executemany("""
+        INSERT INTO tasks (title, description, status, created_at, updated_at)
+        VALUES (?, '', ?, ?, ?)
+    """, TASKS)
+    db.conn.commit()
+    db.close()
+    return path
+
+
+@pytest.fixture
+def report(db_path):
+    generator = ReportGenerator(db_path, workers=2, chunk_size=3, stale_days=14)
+    return generator.generate(now=NOW)
+
+
+def test_percentile_nearest_rank():
+    assert _percentile([1, 2, 3, 4, 5], 50) == 3
+    assert _percentile(list(range(1, 11)), 85) == 9
+    assert _percentile(list(range(1, 11)), 95) == 10
+    assert _percentile([7], 50) == 7
+    assert _percentile([], 50) is None
+
+
+def test_status_counts_and_age(report):
+    status = {row["status"]: row for row in report["status"]}
+    assert report["total_tasks"] == 7
+    assert status["Done"]["count"] == 4
+    assert status["To Do"]["count"] == 2
+    assert status["In Progress"]["count"] == 1
+    # Open cards age up to the report time, not to their last edit.
+    assert status["To Do"]["avg_age_days"] == pytest.approx((1 + 21) / 2)
+    assert status["In Progress"]["avg_age_days"] == pytest.approx(40)
+    assert status["Done"]["avg_age_days"] == pytest.approx(2.5)
+
+
+def test_cycle_time(report):
+    assert report["cycle_time_days"] == {
+        "count": 4, "mean": 2.5, "median": 2.0, "p85": 4.0, "p95": 4.0, "max": 4.0
+    }
+
+
+def test_weekly_throughput_spans_year_boundary(report):
+    assert report["weekly_throughput"] == [
+        {"week_start": "2025-12-29", "done": 3},
+        {"week_start": "2026-01-05", "done": 1},
+    ]
+
+
+def test_stale_cutoff(report):
+    assert [task["title"] for task in report["stale_tasks"]] == ["old todo", "stale wip"]
+
+
+def test_empty_database(tmp_path):
+    path = str(tmp_path / "empty.db")
+    Database(path).close()
+    report = ReportGenerator(path).generate(now=NOW)
+    assert report["total_tasks"] == 0
+    assert report["cycle_time_days"]["median"] is None
+    assert report["stale_tasks"] == []
+
+
+def test_write_json(db_path, report, tmp_path):
+    generator = ReportGenerator(db_path)
+    paths = generator.write(report, str(tmp_path / "out"), "json")
+    with open(paths[0]) as f:
+        assert json.load(f) == report
+
+
+def test_write_csv(db_path, report, tmp_path):
+    generator = ReportGenerator(db_path)
+    out_dir = str(tmp_path / "out")
+    paths = generator.write(report, out_dir, "csv")
+    assert sorted(os.path.basename(p) for p in paths) == [
+        "cycle_time.csv", "stale_tasks.csv", "status.csv", "throughput.csv"
+    ]
+    with open(os.path.join(out_dir, "throughput.csv"), newline='') as f:
+        assert list(csv.DictReader(f)) == [
+            {"week_start": "2025-12-29", "done": "3"},
+            {"week_start": "2026-01-05", "done": "1"},
+        ]
+
+
+def test_write_rejects_unknown_format(db_path, report, tmp_path):
+    with pytest.raises(ValueError):
+        ReportGenerator(db_path).write(report, str(tmp_path), "xml")
+
+
+def test_warns_when_not_wal(tmp_path, capsys):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE tasks (id INTEGER PRIMARY KEY, title TEXT, description TEXT,
+                            status TEXT, created_at TEXT, updated_at TEXT)
+    """)
+    conn.close()
+    ReportGenerator(path).id_ranges()
+    assert "journal_mode=delete" in capsys.readouterr().out